@@ -13,229 +13,584 @@ Author: Security Team
 Version: 1.0
 """
 
+import hashlib
+import os
+import pickle
 import re
-import urllib.parse
 import socket
-from typing import List, Dict, Tuple
+import sys
+from bisect import bisect_right
+from typing import List, Dict, Optional, Tuple
 from email.parser import Parser
-from collections import defaultdict
+from collections import defaultdict, Counter
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 import ssl
 import requests
 from urllib3.exceptions import InsecureRequestWarning
-requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)  # type: ignore[attr-defined]
 
-class PhishingDetector:
-    def __init__(self):
-        # Common phishing keywords and patterns
-        self.suspicious_keywords = {
-            # General phishing patterns
-            'urgent': 0.3,
-            'account suspended': 0.4,
-            'verify your account': 0.4,
-            'login attempt': 0.3,
-            'unusual activity': 0.3,
-            'password expired': 0.4,
-            'security alert': 0.3,
-            'click here': 0.2,
-            'confirm identity': 0.4,
-            'unusual login': 0.3,
-            'limited time': 0.2,
-            'account closure': 0.4,
-            'suspicious activity': 0.4,
-            
-            # Fiverr-specific patterns
-            'external payment': 0.8,
-            'paypal only': 0.7,
-            'western union': 0.8,
-            'direct payment': 0.7,
-            'contact outside': 0.6,
-            'whatsapp': 0.5,
-            'telegram': 0.5,
-            'bonus offer': 0.4,
-            'special promotion': 0.4,
-            'fiverr support team': 0.5,
-            'account verification required': 0.6,
-            'order completed': 0.4,
-            'payment pending': 0.4,
-            'urgent payment': 0.6,
-            'refund processing': 0.5,
-            'additional fee': 0.5,
-            'cryptocurrency': 0.7,
-            'bitcoin payment': 0.8,
-            'private email': 0.6,
-            'skype chat': 0.5
-        }
-        
-        # Suspicious TLD patterns
-        self.suspicious_tlds = [
-            '.tk', '.ml', '.ga', '.cf', '.gq',  # Free TLDs often used in phishing
-            '.zip', '.review', '.country', '.kim', '.science',
-            '.work', '.party', '.gdn', '.stream', '.download'
-        ]
-        
-        # Suspicious sender patterns
-        self.suspicious_sender_patterns = [
-            # General patterns
-            r'^\d+@',  # Starts with numbers
-            r'[a-zA-Z0-9]+\d{4,}@',  # Contains 4 or more consecutive numbers
-            r'security[_-]?alert',
-            r'account[_-]?verify',
-            r'support[_-]?\d+',
-            
-            # Fiverr-specific patterns
-            r'fiverr[._-]?support\d*@',
-            r'fiverr[._-]?security@',
-            r'fiverr[._-]?payment@',
-            r'fiverr[._-]?verify@',
-            r'fiverr[._-]?team@',
-            r'admin[._-]?fiverr@',
-            r'support[._-]?team[._-]?\d*@',
-            r'verification[._-]?team@',
-            r'payment[._-]?support@',
-            r'account[._-]?security@'
-        ]
-
-    def analyze_urls(self, text: str) -> List[Dict]:
-        """
-        Analyze URLs found in the text for suspicious patterns.
-        """
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        results = []
-        
-        for url in urls:
-            risk_score = 0
-            reasons = []
-            
-            parsed_url = urllib.parse.urlparse(url)
-            
-            # Check for suspicious TLDs
-            domain = parsed_url.netloc.lower()
-            for tld in self.suspicious_tlds:
-                if domain.endswith(tld):
-                    risk_score += 0.4
-                    reasons.append(f"Suspicious TLD: {tld}")
-            
-            # Check for IP addresses instead of domain names
-            if re.match(r'^\d+\.\d+\.\d+\.\d+$', parsed_url.netloc):
-                risk_score += 0.5
-                reasons.append("IP address used instead of domain name")
-            
-            # Check for deceptive subdomains
-            if parsed_url.netloc.count('.') > 2:
-                risk_score += 0.3
-                reasons.append("Multiple subdomains detected")
-            
-            # Check for URL encoding tricks
-            if '%' in url:
-                risk_score += 0.3
-                reasons.append("URL contains encoded characters")
-            
-            results.append({
-                'url': url,
-                'risk_score': risk_score,
-                'reasons': reasons
-            })
-            
-        return results
-
-    def analyze_keywords(self, text: str) -> Tuple[float, List[str]]:
-        """
-        Analyze text for suspicious keywords and phrases.
-        """
-        text = text.lower()
-        total_score = 0
-        detected_keywords = []
-        
-        for keyword, score in self.suspicious_keywords.items():
-            if keyword in text:
+# Optional fast keyword-matching backends. pyahocorasick (C extension) is
+# preferred; flashtext is a pure-Python single-pass alternative. Without
+# either we fall back to the plain per-keyword substring scan.
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
+try:
+    from flashtext import KeywordProcessor  # type: ignore
+except ImportError:
+    KeywordProcessor = None  # type: ignore
+# Optional Hyperscan backend: compiles all signature classes into one
+# multi-pattern database scanned in a single pass
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None  # type: ignore
+# Optional numpy + numba for the compiled batch score reducer
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None  # type: ignore
+
+
+# ---------------------------------------------------------------------------
+# Detection tables. Module-level and frozen so the hot functions reach them
+# with a plain global lookup instead of per-call attribute resolution.
+# ---------------------------------------------------------------------------
+
+# Common phishing keywords and patterns
+SUSPICIOUS_KEYWORDS: Dict[str, float] = {
+    # General phishing patterns
+    'urgent': 0.3,
+    'account suspended': 0.4,
+    'verify your account': 0.4,
+    'login attempt': 0.3,
+    'unusual activity': 0.3,
+    'password expired': 0.4,
+    'security alert': 0.3,
+    'click here': 0.2,
+    'confirm identity': 0.4,
+    'unusual login': 0.3,
+    'limited time': 0.2,
+    'account closure': 0.4,
+    'suspicious activity': 0.4,
+
+    # Fiverr-specific patterns
+    'external payment': 0.8,
+    'paypal only': 0.7,
+    'western union': 0.8,
+    'direct payment': 0.7,
+    'contact outside': 0.6,
+    'whatsapp': 0.5,
+    'telegram': 0.5,
+    'bonus offer': 0.4,
+    'special promotion': 0.4,
+    'fiverr support team': 0.5,
+    'account verification required': 0.6,
+    'order completed': 0.4,
+    'payment pending': 0.4,
+    'urgent payment': 0.6,
+    'refund processing': 0.5,
+    'additional fee': 0.5,
+    'cryptocurrency': 0.7,
+    'bitcoin payment': 0.8,
+    'private email': 0.6,
+    'skype chat': 0.5
+}
+
+# Suspicious TLD patterns
+SUSPICIOUS_TLDS: Tuple[str, ...] = (
+    '.tk', '.ml', '.ga', '.cf', '.gq',  # Free TLDs often used in phishing
+    '.zip', '.review', '.country', '.kim', '.science',
+    '.work', '.party', '.gdn', '.stream', '.download'
+)
+
+# Suspicious sender patterns
+SUSPICIOUS_SENDER_PATTERNS: Tuple[str, ...] = (
+    # General patterns
+    r'^\d+@',  # Starts with numbers
+    r'[a-zA-Z0-9]+\d{4,}@',  # Contains 4 or more consecutive numbers
+    r'security[_-]?alert',
+    r'account[_-]?verify',
+    r'support[_-]?\d+',
+
+    # Fiverr-specific patterns
+    r'fiverr[._-]?support\d*@',
+    r'fiverr[._-]?security@',
+    r'fiverr[._-]?payment@',
+    r'fiverr[._-]?verify@',
+    r'fiverr[._-]?team@',
+    r'admin[._-]?fiverr@',
+    r'support[._-]?team[._-]?\d*@',
+    r'verification[._-]?team@',
+    r'payment[._-]?support@',
+    r'account[._-]?security@'
+)
+
+# Set of suspicious TLDs (without the leading dot) for O(1) lookup on a
+# URL's last domain label
+_TLD_SET = frozenset(tld.lstrip('.').lower() for tld in SUSPICIOUS_TLDS)
+
+# Compiled regexes, built once at import.
+# The URL body is a single character class ('!', '$' through '_' which
+# covers digits, uppercase, %, &, / etc., and lowercase) -- equivalent to
+# the old nested alternation but immune to backtracking blowups on
+# crafted input
+_URL_RE = re.compile(r'https?://[!$-_a-z]+')
+_HOST_RE = re.compile(r'^https?://([^/?#]+)', re.I)
+# The individual sender patterns, plus a fused alternation used as a
+# prefilter: one scan of the union decides whether the header matches any
+# pattern at all, and only then are the individual patterns run to
+# attribute every co-occurring match (finditer over the union alone would
+# consume text and drop patterns overlapping an earlier alternative)
+_SENDER_RES = tuple(re.compile(pattern, re.I)
+                    for pattern in SUSPICIOUS_SENDER_PATTERNS)
+_SENDER_UNION = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in SUSPICIOUS_SENDER_PATTERNS),
+    re.I)
+
+# The built automaton is pickled next to the module so worker processes
+# load it instead of rebuilding; under preload-style process managers the
+# loaded object is then COW-shared across forks. Fingerprinting the
+# keyword table invalidates the cache when the keywords change.
+_AUTOMATON_CACHE = os.environ.get(
+    'PHISHING_DETECTOR_AUTOMATON_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.kw_automaton.pickle'))
+
+
+def _load_or_build_automaton():
+    """
+    Return the keyword automaton, loading it from the on-disk cache when
+    the cached fingerprint matches the current keyword table and
+    rebuilding (and re-persisting) it otherwise.
+    """
+    fingerprint = hashlib.sha256(
+        repr(sorted(SUSPICIOUS_KEYWORDS.items())).encode()).hexdigest()
+    try:
+        with open(_AUTOMATON_CACHE, 'rb') as cache_file:
+            cached_fingerprint, automaton = pickle.load(cache_file)
+        if cached_fingerprint == fingerprint:
+            return automaton
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+        pass
+
+    automaton = ahocorasick.Automaton()
+    for keyword, score in SUSPICIOUS_KEYWORDS.items():
+        automaton.add_word(keyword, (keyword, score))
+    automaton.make_automaton()
+    try:
+        with open(_AUTOMATON_CACHE, 'wb') as cache_file:
+            pickle.dump((fingerprint, automaton), cache_file)
+    except OSError:
+        pass  # read-only install location; rebuild per process
+    return automaton
+
+
+# Build a single-pass keyword matcher so each message is scanned once
+# instead of once per keyword
+_KW_AUTOMATON = None
+_KW_PROCESSOR = None
+if ahocorasick is not None:
+    _KW_AUTOMATON = _load_or_build_automaton()
+elif KeywordProcessor is not None:
+    _KW_PROCESSOR = KeywordProcessor()
+    for _kw in SUSPICIOUS_KEYWORDS:
+        _KW_PROCESSOR.add_keyword(_kw)
+
+# When Hyperscan is available, fuse keywords and sender patterns into one
+# JIT'd multi-pattern database. Pattern ids below _HS_KW_COUNT are
+# keywords, the rest map to sender patterns. TLD scoring stays on the
+# per-URL set lookup since whole-message scanning cannot attribute a TLD
+# hit to a specific URL.
+_HS_DB = None
+_HS_KW_COUNT = len(SUSPICIOUS_KEYWORDS)
+if hyperscan is not None:
+    _hs_expressions = ([re.escape(kw).encode() for kw in SUSPICIOUS_KEYWORDS]
+                       + [p.encode() for p in SUSPICIOUS_SENDER_PATTERNS])
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(expressions=_hs_expressions,
+                   ids=list(range(len(_hs_expressions))),
+                   flags=[hyperscan.HS_FLAG_CASELESS] * len(_hs_expressions))
+
+# Keyword table in struct-of-arrays form: the interned keyword strings
+# and their scores live in parallel sequences indexed by keyword id, so
+# scans iterate positionally and score lookups are array indexing rather
+# than dict probes. The numpy copy feeds the compiled batch reducer.
+_KW_STRS = tuple(sys.intern(kw) for kw in SUSPICIOUS_KEYWORDS)
+_KW_SCORES = tuple(SUSPICIOUS_KEYWORDS.values())
+_KW_IDS = {kw: i for i, kw in enumerate(_KW_STRS)}
+_KW_SCORE_ARR = (np.fromiter(SUSPICIOUS_KEYWORDS.values(), dtype=np.float64)
+                 if np is not None else None)
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _reduce_scores(msg_ids, kw_ids, score_table, n_msgs):
+        out = np.zeros(n_msgs, dtype=np.float64)
+        for i in range(msg_ids.size):
+            out[msg_ids[i]] += score_table[kw_ids[i]]
+        return out
+else:
+    _reduce_scores = None
+
+def _empty_result() -> Dict:
+    """
+    Build the Low-risk result for the no-input fast path.
+
+    Constructed fresh per call: callers may mutate the nested lists and
+    dicts of a returned result, so no structure can be shared.
+    """
+    return {
+        'overall_risk_score': 0.0,
+        'risk_level': 'Low',
+        'url_analysis': [],
+        'keyword_analysis': {'score': 0.0, 'detected_keywords': []},
+        'header_analysis': {},
+        'recommendations': ["Message appears to be legitimate but always exercise caution"],
+    }
+
+
+@dataclass(slots=True)
+class UrlResult:
+    """Per-URL analysis outcome."""
+    url: str
+    risk_score: float
+    count: int
+    reasons: List[str]
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """Full analysis outcome for one message."""
+    overall_risk_score: float = 0.0
+    risk_level: str = ''
+    url_analysis: List[UrlResult] = field(default_factory=list)
+    keyword_analysis: Dict = field(default_factory=dict)
+    header_analysis: Dict = field(default_factory=dict)
+    recommendations: List[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=4096)
+def _classify_sender(from_hdr: str) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Extract the sender domain and the matching sender-pattern indices
+    for a From header.
+
+    Cached on the raw header string: phishing campaigns repeat sender
+    addresses heavily, so repeat senders skip the regex scan entirely.
+    The cache assumes the sender patterns are import-time constants; any
+    code that rebuilds them must also call _classify_sender.cache_clear().
+    """
+    domain = from_hdr.split('@')[-1]
+    matched: Tuple[int, ...] = ()
+    if _SENDER_UNION.search(from_hdr):
+        matched = tuple(i for i, regex in enumerate(_SENDER_RES)
+                        if regex.search(from_hdr))
+    return domain, matched
+
+
+def _hs_scan(data: bytes) -> set:
+    """
+    Scan a byte buffer through the fused Hyperscan database and return
+    the set of matched pattern ids.
+    """
+    assert _HS_DB is not None
+    hit_ids: set = set()
+    _HS_DB.scan(
+        data,
+        match_event_handler=lambda pid, start, end, flags, ctx: hit_ids.add(pid))
+    return hit_ids
+
+
+def analyze_urls(text: str) -> Tuple[List[UrlResult], float]:
+    """
+    Analyze URLs found in the text for suspicious patterns.
+
+    Repeated URLs are analyzed once; each result carries a 'count' of
+    occurrences. Returns the per-URL results together with the total
+    risk score (weighted by occurrence count), accumulated in the same
+    pass.
+    """
+    url_counts = Counter(_URL_RE.findall(text))
+    results = []
+    total: float = 0.0
+
+    for url in url_counts:
+        risk_score: float = 0.0
+        reasons: List[str] = []
+
+        host_match = _HOST_RE.match(url)
+        domain = host_match.group(1).lower() if host_match else ''
+
+        # One split of the domain feeds the TLD, IPv4 and subdomain
+        # checks; each remaining probe is a memchr-class primitive
+        labels = domain.split('.')
+
+        # Check for suspicious TLDs
+        if labels[-1] in _TLD_SET:
+            risk_score += 0.4
+            reasons.append(f"Suspicious TLD: .{labels[-1]}")
+
+        # Check for IP addresses instead of domain names; a four-branch
+        # digit check beats running a regex per URL
+        if len(labels) == 4 and all(label.isdigit() and int(label) < 256
+                                    for label in labels):
+            risk_score += 0.5
+            reasons.append("IP address used instead of domain name")
+
+        # Check for deceptive subdomains
+        if len(labels) > 3:
+            risk_score += 0.3
+            reasons.append("Multiple subdomains detected")
+
+        # Check for URL encoding tricks
+        if url.find('%') != -1:
+            risk_score += 0.3
+            reasons.append("URL contains encoded characters")
+
+        results.append(UrlResult(url=url,
+                                 risk_score=risk_score,
+                                 count=url_counts[url],
+                                 reasons=reasons))
+        total += risk_score * url_counts[url]
+
+    return results, total
+
+
+def analyze_keywords(text_lower: str) -> Tuple[float, List[str]]:
+    """
+    Analyze already-lowercased text for suspicious keywords and phrases.
+
+    The caller is expected to pass text.lower() so the lowered copy can
+    be shared across analysis stages instead of re-allocated here.
+    """
+    text = text_lower
+    total_score: float = 0.0
+    detected_keywords: List[str] = []
+    seen = set()
+
+    if _HS_DB is not None:
+        for pattern_id in sorted(_hs_scan(text.encode())):
+            if pattern_id < _HS_KW_COUNT:
+                total_score += _KW_SCORES[pattern_id]
+                detected_keywords.append(_KW_STRS[pattern_id])
+    elif _KW_AUTOMATON is not None:
+        for _, (keyword, score) in _KW_AUTOMATON.iter(text):
+            if keyword not in seen:
+                seen.add(keyword)
                 total_score += score
                 detected_keywords.append(keyword)
-        
-        return total_score, detected_keywords
+    elif _KW_PROCESSOR is not None:
+        for keyword in _KW_PROCESSOR.extract_keywords(text):
+            if keyword not in seen:
+                seen.add(keyword)
+                total_score += SUSPICIOUS_KEYWORDS[keyword]
+                detected_keywords.append(keyword)
+    else:
+        for i, keyword in enumerate(_KW_STRS):
+            if keyword in text:
+                total_score += _KW_SCORES[i]
+                detected_keywords.append(keyword)
 
-    def analyze_headers(self, headers: Dict) -> Tuple[float, List[str]]:
-        """
-        Analyze email headers for suspicious patterns.
-        """
-        score = 0
-        reasons = []
-        
-        # Check Reply-To mismatch
-        if 'from' in headers and 'reply-to' in headers:
+    return total_score, detected_keywords
+
+
+def analyze_headers(headers: Dict) -> Tuple[float, List[str]]:
+    """
+    Analyze email headers for suspicious patterns.
+    """
+    score: float = 0.0
+    reasons: List[str] = []
+
+    if 'from' in headers:
+        # Classify the sender once per distinct address; campaigns reuse
+        # sender addresses so the cache hit rate is high
+        if _HS_DB is not None:
             from_domain = headers['from'].split('@')[-1]
+            matched_patterns = tuple(sorted(
+                pid - _HS_KW_COUNT
+                for pid in _hs_scan(headers['from'].encode())
+                if pid >= _HS_KW_COUNT))
+        else:
+            from_domain, matched_patterns = _classify_sender(headers['from'])
+
+        # Check Reply-To mismatch
+        if 'reply-to' in headers:
             reply_domain = headers['reply-to'].split('@')[-1]
             if from_domain != reply_domain:
                 score += 0.4
                 reasons.append("Reply-To domain mismatch")
-        
+
         # Check for suspicious sender patterns
-        if 'from' in headers:
-            for pattern in self.suspicious_sender_patterns:
-                if re.search(pattern, headers['from'], re.I):
-                    score += 0.3
-                    reasons.append(f"Suspicious sender pattern: {pattern}")
-        
-        # Check for missing or suspicious headers
-        important_headers = ['received', 'authentication-results', 'dkim-signature']
-        for header in important_headers:
-            if header not in headers:
-                score += 0.2
-                reasons.append(f"Missing important header: {header}")
-        
-        return score, reasons
-
-    def analyze_message(self, message_text: str, headers: Dict = None) -> Dict:
-        """
-        Perform complete analysis of a message.
-        """
-        total_score = 0
-        analysis_results = {
-            'overall_risk_score': 0,
-            'risk_level': '',
-            'url_analysis': [],
-            'keyword_analysis': [],
-            'header_analysis': [],
-            'recommendations': []
-        }
-        
-        # Analyze URLs
-        url_results = self.analyze_urls(message_text)
-        analysis_results['url_analysis'] = url_results
-        url_score = sum(result['risk_score'] for result in url_results)
+        for index in matched_patterns:
+            score += 0.3
+            reasons.append(f"Suspicious sender pattern: "
+                           f"{SUSPICIOUS_SENDER_PATTERNS[index]}")
+
+    # Check for missing or suspicious headers
+    important_headers = ['received', 'authentication-results', 'dkim-signature']
+    for header in important_headers:
+        if header not in headers:
+            score += 0.2
+            reasons.append(f"Missing important header: {header}")
+
+    return score, reasons
+
+
+def _batch_keyword_scan(lowered_texts: List[str]) -> List[Tuple[float, List[str]]]:
+    """
+    Run the keyword scan over a batch of already-lowered texts.
+
+    With the Aho-Corasick backend the texts are joined with a NUL
+    sentinel and scanned in a single automaton pass; match positions are
+    mapped back to their source message via bisect over the cumulative
+    offsets. Without it, each text is scanned separately.
+    """
+    if _KW_AUTOMATON is None:
+        return [analyze_keywords(text) for text in lowered_texts]
+
+    starts = []
+    offset = 0
+    for text in lowered_texts:
+        starts.append(offset)
+        offset += len(text) + 1  # +1 for the sentinel
+    buffer = '\x00'.join(lowered_texts)
+
+    detected: List[List[str]] = [[] for _ in lowered_texts]
+    seen: List[set] = [set() for _ in lowered_texts]
+    hit_msg_ids: List[int] = []
+    hit_kw_ids: List[int] = []
+    for end_index, (keyword, score) in _KW_AUTOMATON.iter(buffer):
+        i = bisect_right(starts, end_index) - 1
+        if keyword not in seen[i]:
+            seen[i].add(keyword)
+            detected[i].append(keyword)
+            hit_msg_ids.append(i)
+            hit_kw_ids.append(_KW_IDS[keyword])
+
+    # Reduce (message id, keyword id) hit pairs to per-message totals;
+    # with numba this is one compiled loop over int arrays
+    if _reduce_scores is not None:
+        totals = _reduce_scores(np.asarray(hit_msg_ids, dtype=np.int32),
+                                np.asarray(hit_kw_ids, dtype=np.int32),
+                                _KW_SCORE_ARR, len(lowered_texts))
+        scores = [float(total) for total in totals]
+    else:
+        scores = [0.0] * len(lowered_texts)
+        for i, kw_id in zip(hit_msg_ids, hit_kw_ids):
+            scores[i] += _KW_SCORES[kw_id]
+
+    return list(zip(scores, detected))
+
+
+def analyze_messages(texts: List[str], headers_list: Optional[List[Optional[Dict]]] = None) -> List[Dict]:
+    """
+    Perform complete analysis of a batch of messages.
+
+    Amortizes per-message fixed costs: keywords for the whole batch are
+    matched in one automaton pass and the analyzers are bound to locals
+    outside the per-message loop.
+    """
+    if headers_list is None:
+        headers_list = [None] * len(texts)
+
+    keyword_results = _batch_keyword_scan([text.lower() for text in texts])
+
+    all_results = []
+    for message_text, headers, (keyword_score, detected_keywords) in zip(
+            texts, headers_list, keyword_results):
+        # Fast path: nothing to analyze
+        if not message_text and not headers:
+            all_results.append(_empty_result())
+            continue
+
+        total_score: float = 0.0
+        result = AnalysisResult()
+
+        # Analyze URLs; the substring probe is a single C-level scan and
+        # most legitimate messages carry no URL at all
+        if 'http' in message_text:
+            url_results, url_score = analyze_urls(message_text)
+        else:
+            url_results, url_score = [], 0.0
+        result.url_analysis = url_results
         total_score += url_score
-        
-        # Analyze keywords
-        keyword_score, detected_keywords = self.analyze_keywords(message_text)
-        analysis_results['keyword_analysis'] = {
+
+        # Keyword results from the batch scan
+        result.keyword_analysis = {
             'score': keyword_score,
             'detected_keywords': detected_keywords
         }
         total_score += keyword_score
-        
+
         # Analyze headers if provided
         if headers:
-            header_score, header_reasons = self.analyze_headers(headers)
-            analysis_results['header_analysis'] = {
+            header_score, header_reasons = analyze_headers(headers)
+            result.header_analysis = {
                 'score': header_score,
                 'reasons': header_reasons
             }
             total_score += header_score
-        
+
         # Calculate final risk score and level
-        analysis_results['overall_risk_score'] = min(total_score, 1.0)
-        
-        if analysis_results['overall_risk_score'] >= 0.7:
-            analysis_results['risk_level'] = 'High'
-            analysis_results['recommendations'].append("Block this message immediately")
-        elif analysis_results['overall_risk_score'] >= 0.4:
-            analysis_results['risk_level'] = 'Medium'
-            analysis_results['recommendations'].append("Review message carefully before taking any action")
+        result.overall_risk_score = min(total_score, 1.0)
+
+        if result.overall_risk_score >= 0.7:
+            result.risk_level = 'High'
+            result.recommendations.append("Block this message immediately")
+        elif result.overall_risk_score >= 0.4:
+            result.risk_level = 'Medium'
+            result.recommendations.append("Review message carefully before taking any action")
         else:
-            analysis_results['risk_level'] = 'Low'
-            analysis_results['recommendations'].append("Message appears to be legitimate but always exercise caution")
-        
-        return analysis_results
+            result.risk_level = 'Low'
+            result.recommendations.append("Message appears to be legitimate but always exercise caution")
+
+        # Convert to plain dicts at the API boundary only
+        all_results.append(asdict(result))
+
+    return all_results
+
+
+def analyze_message(message_text: str, headers: Optional[Dict] = None) -> Dict:
+    """
+    Perform complete analysis of a message.
+    """
+    return analyze_messages([message_text], [headers])[0]
+
+
+class PhishingDetector:
+    """
+    Thin object-oriented wrapper over the module-level analyzers.
+
+    All detection state lives at module scope (frozen tables, compiled
+    regexes, prebuilt matchers) so instances are free to construct and
+    the hot functions avoid per-call attribute lookups.
+    """
+
+    def __init__(self):
+        self.suspicious_keywords = SUSPICIOUS_KEYWORDS
+        self.suspicious_tlds = SUSPICIOUS_TLDS
+        self.suspicious_sender_patterns = SUSPICIOUS_SENDER_PATTERNS
+
+    def analyze_urls(self, text: str) -> Tuple[List[UrlResult], float]:
+        return analyze_urls(text)
+
+    def analyze_keywords(self, text_lower: str) -> Tuple[float, List[str]]:
+        return analyze_keywords(text_lower)
+
+    def analyze_headers(self, headers: Dict) -> Tuple[float, List[str]]:
+        return analyze_headers(headers)
+
+    def analyze_messages(self, texts: List[str], headers_list: Optional[List[Optional[Dict]]] = None) -> List[Dict]:
+        return analyze_messages(texts, headers_list)
+
+    def analyze_message(self, message_text: str, headers: Optional[Dict] = None) -> Dict:
+        return analyze_message(message_text, headers)
+
 
 def main():
     """
@@ -244,34 +599,34 @@ def main():
     # Example message for testing
     test_message = """
     URGENT: Fiverr Payment Issue Detected!
-    
+
     Dear Seller,
-    
+
     We have detected an issue with your recent payment. To prevent any delays, please verify your account immediately
     by clicking here: http://fiverr-secure-payments.tk/verify
-    
+
     Additionally, you can expedite the process by contacting our support team on WhatsApp: +1234567890
     or make a direct payment through our secure Bitcoin wallet: 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa
-    
+
     If you don't confirm within 24 hours, your pending payments will be cancelled.
-    
+
     Best regards,
     Fiverr Support Team
     """
-    
+
     # Example headers
     test_headers = {
         'from': 'fiverr-support-team@fiverr-secure-payments.tk',
         'reply-to': 'support-team@payment-verify.ml',
         'subject': 'Urgent: Fiverr Payment Verification Required'
     }
-    
+
     # Create detector instance
     detector = PhishingDetector()
-    
+
     # Analyze message
     results = detector.analyze_message(test_message, test_headers)
-    
+
     # Print results
     print("\nPhishing Detection Results:")
     print("-" * 50)
@@ -292,4 +647,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-